@@ -0,0 +1,282 @@
+#############################
+# [iShop]  ver 1.0  harness #
+#############################
+import argparse
+import concurrent.futures
+import contextlib
+import hashlib
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import prettytable as pt
+from main import Manager
+
+
+def checksum(path: str) -> str or None:
+    """ calculate the checksum of a data file
+    :param path: path of the data file
+    :return: sha256 hex digest of the file or None if not found
+    """
+    try:
+        with open(path, 'rb') as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def percentile(values: list, percent: float) -> float:
+    """ calculate the percentile of sorted values (nearest rank)
+    :param values: sorted values
+    :param percent: percentile to calculate, from 0 to 100
+    :return: percentile of the values or 0.0 if empty
+    """
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+
+class RecordManager(Manager):
+    """
+    Class: Program Manager recording every input of a session
+    """
+    def __init__(self, username: str, password: str = '', data_file_path: str = Manager.DATA_FILE_PATH):
+        """
+        :param username: username of the admin
+        :param password: password of the admin
+        :param data_file_path: path of the data file to load from and save into
+        """
+        super().__init__(username, password, data_file_path)
+        self.inputs = []
+
+    def read_input(self, prompt: str) -> str:
+        """ read one line of input and record it with its prompt
+        :param prompt: prompt to display
+        :return: line of input
+        """
+        value = input(prompt)
+        self.inputs.append([prompt, value])
+        return value
+
+
+class ReplayManager(Manager):
+    """
+    Class: Program Manager replaying the recorded inputs of a session
+    """
+    def __init__(self, username: str, password: str, data_file_path: str, inputs: list):
+        """
+        :param username: username of the admin
+        :param password: password of the admin
+        :param data_file_path: path of the data file to load from and save into
+        :param inputs: recorded [prompt, input] pairs to replay
+        """
+        super().__init__(username, password, data_file_path)
+        self.inputs = inputs
+        self.position = 0
+        self.mismatches = 0      # number of prompts differing from the recorded ones
+        self.latencies = []      # seconds spent on each command
+        self.command_start = None
+
+    def read_input(self, prompt: str) -> str:
+        """ feed the next recorded input, timing each command
+        :param prompt: prompt to display
+        :return: recorded line of input
+        """
+        # a command prompt ends the previous command
+        if prompt.endswith('>>>'):
+            self.finish_command()
+        if self.position >= len(self.inputs):
+            # failed: recorded inputs exhausted
+            raise EOFError
+        recorded_prompt, value = self.inputs[self.position]
+        self.position += 1
+        if recorded_prompt != prompt:
+            self.mismatches += 1
+        if prompt.endswith('>>>'):
+            self.command_start = time.perf_counter()
+        return value
+
+    def finish_command(self):
+        """ record the latency of the pending command
+        """
+        if self.command_start is not None:
+            self.latencies.append(time.perf_counter() - self.command_start)
+            self.command_start = None
+
+
+def record(trace_path: str, username: str, password: str, data_file_path: str) -> int:
+    """ run an interactive session and append it to the trace file
+    :param trace_path: path of the trace file
+    :param username: username of the admin
+    :param password: password of the admin
+    :param data_file_path: path of the data file to load from and save into
+    :return: exit status
+    """
+    # * keep the initial store so that the session can be replayed from it *
+    try:
+        with open(data_file_path, 'r') as file:
+            store = file.read()
+    except FileNotFoundError:
+        store = None
+    # * perform session *
+    manager = RecordManager(username, password, data_file_path)
+    try:
+        manager.run()
+    except (EOFError, KeyboardInterrupt):
+        print('\n* [Failed] Session interrupted, not recorded.')
+        return 1
+    # * append session *
+    session = {
+        'username': username,
+        'password': password,
+        'store': store,
+        'inputs': manager.inputs,
+        'checksum': checksum(data_file_path),
+    }
+    with open(trace_path, 'a') as file:
+        file.write(json.dumps(session) + '\n')
+    print('* [Succeed] Record session into <' + trace_path + '> successfully.')
+    return 0
+
+
+def replay_session(session: dict, data_file_path: str) -> dict:
+    """ replay one recorded session against a data file
+    :param session: recorded session
+    :param data_file_path: path of the data file to load from and save into
+    :return: result of the session
+    """
+    manager = ReplayManager(session['username'], session['password'], data_file_path, session['inputs'])
+    completed = True
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            manager.run()
+            manager.finish_command()  # <exit> finishes after saving
+        except EOFError:
+            # failed: session diverged and ran out of inputs
+            completed = False
+    return {
+        'elapsed': time.perf_counter() - start,
+        'latencies': manager.latencies,
+        'mismatches': manager.mismatches,
+        'completed': completed,
+        'checksum': checksum(data_file_path) if completed else None,
+    }
+
+
+def replay(trace_path: str, workers: int = 1, repeat: int = 1, shared: bool = False) -> dict:
+    """ replay every recorded session of the trace file
+    :param trace_path: path of the trace file
+    :param workers: number of worker processes, 1 to replay in this process
+    :param repeat: number of times to replay each session
+    :param shared: whether all sessions share one store instead of a separate store each
+    :return: report of the replay
+    """
+    with open(trace_path, 'r') as file:
+        sessions = [json.loads(line) for line in file if line.strip()] * repeat
+    with tempfile.TemporaryDirectory() as directory:
+        # * prepare stores *
+        paths = []
+        for i in range(len(sessions)):
+            path = os.path.join(directory, 'data.txt' if shared else 'data-' + str(i) + '.txt')
+            if (not shared or i == 0) and sessions[i]['store'] is not None:
+                with open(path, 'w') as file:
+                    file.write(sessions[i]['store'])
+            paths.append(path)
+        # * perform replay *
+        start = time.perf_counter()
+        if workers > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(replay_session, sessions, paths))
+        else:
+            results = [replay_session(sessions[i], paths[i]) for i in range(len(sessions))]
+        elapsed = time.perf_counter() - start
+        store_checksum = checksum(paths[0]) if shared and paths else None
+    # * summarize results *
+    latencies = sorted(latency for result in results for latency in result['latencies'])
+    report = {
+        'sessions': len(results),
+        'completed': sum(1 for result in results if result['completed']),
+        'commands': len(latencies),
+        'elapsed': elapsed,
+        'throughput': len(latencies) / elapsed if elapsed > 0 else 0.0,
+        'p50': percentile(latencies, 50),
+        'p90': percentile(latencies, 90),
+        'p99': percentile(latencies, 99),
+        'max': latencies[-1] if latencies else 0.0,
+        'mismatches': sum(result['mismatches'] for result in results),
+        'checksums': [result['checksum'] for result in results],
+        'store_checksum': store_checksum,
+    }
+    if shared:
+        # concurrent sessions overwrite each other's store, so only the final store is meaningful
+        report['checksum_failures'] = 0
+        report['failed'] = False
+    else:
+        report['checksum_failures'] = sum(1 for i in range(len(results)) if results[i]['checksum'] != sessions[i]['checksum'])
+        report['failed'] = report['completed'] < report['sessions'] or report['mismatches'] > 0 or report['checksum_failures'] > 0
+    return report
+
+
+def print_report(report: dict):
+    """ print the report of a replay
+    :param report: report of the replay
+    """
+    # create table with PrettyTable
+    table = pt.PrettyTable()
+    table.field_names = ['Metric', 'Value']
+    table.align = 'l'
+    table.add_row(['Sessions', str(report['completed']) + ' / ' + str(report['sessions']) + ' completed'])
+    table.add_row(['Commands', report['commands']])
+    table.add_row(['Elapsed', str(round(report['elapsed'], 3)) + ' s'])
+    table.add_row(['Throughput', str(round(report['throughput'], 1)) + ' commands / s'])
+    for key in ['p50', 'p90', 'p99', 'max']:
+        table.add_row(['Latency ' + key, str(round(report[key] * 1000, 3)) + ' ms'])
+    table.add_row(['Prompt mismatches', report['mismatches']])
+    if report['store_checksum'] is not None:
+        table.add_row(['Store checksum', report['store_checksum']])
+    else:
+        table.add_row(['Checksum failures', report['checksum_failures']])
+        table.add_row(['Checksums', '\n'.join(sorted(set(str(value) for value in report['checksums'])))])
+    # print the table
+    print(table)
+
+
+def main(argv: list = None) -> int:
+    """ parse command line arguments and run the harness
+    :param argv: command line arguments
+    :return: exit status
+    """
+    parser = argparse.ArgumentParser(description='Record and replay iShop sessions.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    # <record>: record an interactive session
+    record_parser = subparsers.add_parser('record', help='record an interactive session into the trace file')
+    record_parser.add_argument('trace', help='path of the trace file')
+    record_parser.add_argument('--data', default=Manager.DATA_FILE_PATH, help='path of the data file')
+    record_parser.add_argument('--username', default='NUS', help='username of the admin')
+    record_parser.add_argument('--password', default='NUS', help='password of the admin')
+    # <replay>: replay the recorded sessions
+    replay_parser = subparsers.add_parser('replay', help='replay the sessions of the trace file')
+    replay_parser.add_argument('trace', help='path of the trace file')
+    replay_parser.add_argument('--workers', type=int, default=1, help='number of worker processes')
+    replay_parser.add_argument('--repeat', type=int, default=1, help='number of times to replay each session')
+    replay_parser.add_argument('--shared', action='store_true', help='replay all sessions against one shared store')
+    args = parser.parse_args(argv)
+    if args.command == 'record':
+        return record(args.trace, args.username, args.password, args.data)
+    report = replay(args.trace, args.workers, args.repeat, args.shared)
+    print_report(report)
+    if report['failed']:
+        print('* [Failed] Replay diverged from the recorded sessions!')
+        return 1
+    print('* [Succeed] Replay finished successfully.')
+    return 0
+
+
+####################
+# Program Entrance #
+####################
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,6 +2,7 @@
 # [iShop]  ver 1.0 #
 ####################
 import json
+import os
 import prettytable as pt
 
 
@@ -172,11 +173,13 @@ class Manager:
     USER_ONLINE_STATUS = 1   # status code when user logged in
     ADMIN_ONLINE_STATUS = 2  # status code when admin logged in
 
-    def __init__(self, username: str, password: str = ''):
+    def __init__(self, username: str, password: str = '', data_file_path: str = DATA_FILE_PATH):
         """
         :param username: username of the admin
         :param password: password of the admin
+        :param data_file_path: path of the data file to load from and save into
         """
+        self.data_file_path = data_file_path
         self.item_list = []
         self.user_list = []
         self.admin_username = username
@@ -198,11 +201,11 @@ class Manager:
                 # *** Handle User Offline ***
                 self.help()  # print hint for user
                 while True:
-                    user_input = input('\n(?) >>>')
+                    user_input = self.read_input('\n(?) >>>')
                     if user_input == 'logon':
                         # * get input *
-                        username = input('* Please input username:')
-                        password = input('* Please input password:')
+                        username = self.read_input('* Please input username:')
+                        password = self.read_input('* Please input password:')
                         # * perform operation *
                         result = self.logon(username, password)
                         # * check result *
@@ -214,8 +217,8 @@ class Manager:
                             print('* [Succeed] Registered (' + username + ') successfully.')
                     elif user_input == 'login':
                         # * get input *
-                        username = input('* Please input username:')
-                        password = input('* Please input password:')
+                        username = self.read_input('* Please input username:')
+                        password = self.read_input('* Please input password:')
                         # * perform operation *
                         result = self.login(username, password)
                         # * check result *
@@ -237,7 +240,7 @@ class Manager:
                 # *** Handle User Online ***
                 self.help()  # print hint for user
                 while True:
-                    user_input = input('\n(' + self.current_user.username + ') >>>')
+                    user_input = self.read_input('\n(' + self.current_user.username + ') >>>')
                     if user_input == 'shop':
                         # * perform operation *
                         self.print_item_list()
@@ -247,8 +250,8 @@ class Manager:
                     elif user_input == 'insert':
                         # * get input *
                         self.print_item_list()  # print the item list
-                        item_name = input('* Please input item name:')
-                        number = input('* Please input number:')
+                        item_name = self.read_input('* Please input item name:')
+                        number = self.read_input('* Please input number:')
                         # * perform operation *
                         try:
                             number = float(number)
@@ -269,7 +272,7 @@ class Manager:
                     elif user_input == 'delete':
                         # * get input *
                         self.print_item_list()  # print the item list
-                        item_name = input('* Please input item name:')
+                        item_name = self.read_input('* Please input item name:')
                         # * perform operation *
                         result = self.current_user.delete_item(self.search_item(item_name))
                         # * check result *
@@ -281,8 +284,8 @@ class Manager:
                     elif user_input == 'modify':
                         # * get input *
                         self.current_user.print_shopping_list()  # print the shopping list
-                        item_name = input('* Please input item name:')
-                        number = input('* Please input number:')
+                        item_name = self.read_input('* Please input item name:')
+                        number = self.read_input('* Please input number:')
                         # * perform operation *
                         try:
                             number = float(number)
@@ -325,7 +328,7 @@ class Manager:
                 # *** Handle Admin Online ***
                 self.help()  # print hint for user
                 while True:
-                    user_input = input('\n(Admin) >>>')
+                    user_input = self.read_input('\n(Admin) >>>')
                     if user_input == 'user':
                         # * perform operation *
                         self.print_user_list()
@@ -335,9 +338,9 @@ class Manager:
                     elif user_input == 'insert':
                         # * get input *
                         self.print_item_list()  # print the item list
-                        item_name = input('* Please input item name:')
-                        price = input('* Please input price:')
-                        unit = input('* Please input unit:')
+                        item_name = self.read_input('* Please input item name:')
+                        price = self.read_input('* Please input price:')
+                        unit = self.read_input('* Please input unit:')
                         # * perform operation *
                         try:
                             price = float(price)
@@ -356,7 +359,7 @@ class Manager:
                     elif user_input == 'delete':
                         # * get input *
                         self.print_item_list()  # print the item list
-                        item_name = input('* Please input item name:')
+                        item_name = self.read_input('* Please input item name:')
                         # * perform operation *
                         result = self.delete_item(item_name)
                         # * check result *
@@ -368,8 +371,8 @@ class Manager:
                     elif user_input == 'modify':
                         # * get input *
                         self.print_item_list()  # print the item list
-                        item_name = input('* Please input item name:')
-                        price = input('* Please input price:')
+                        item_name = self.read_input('* Please input item name:')
+                        price = self.read_input('* Please input price:')
                         # * perform operation *
                         try:
                             price = float(price)
@@ -412,6 +415,13 @@ class Manager:
         self.save()
         print('* [Succeed] Program exit successfully.')
 
+    def read_input(self, prompt: str) -> str:
+        """ read one line of input for the running shopping system
+        :param prompt: prompt to display
+        :return: line of input
+        """
+        return input(prompt)
+
     def help(self):
         """ print hint for user
         """
@@ -452,7 +462,7 @@ class Manager:
 
     def load(self):
         try:
-            file = open(Manager.DATA_FILE_PATH, 'r+')
+            file = open(self.data_file_path, 'r+')
             item_list_string = file.readline()
             user_list_string = file.readline()
             self.item_list = [Item(item['name'], item['price'], item['unit']) for item in json.loads(item_list_string)]  # convert to object
@@ -461,12 +471,14 @@ class Manager:
                 for user in json.loads(user_list_string)
             ]  # convert to object
             file.close()
-            print('* [Succeed] Load data from <' + Manager.DATA_FILE_PATH + '> successfully.')
+            print('* [Succeed] Load data from <' + self.data_file_path + '> successfully.')
         except FileNotFoundError:
-            print('* [Failed] Load data from <' + Manager.DATA_FILE_PATH + '> failed.')
+            print('* [Failed] Load data from <' + self.data_file_path + '> failed.')
 
     def save(self):
-        file = open('data.txt', 'w')
+        # write into a temporary file first, so that the data file is never seen half written
+        temp_file_path = self.data_file_path + '.' + str(os.getpid()) + '.tmp'
+        file = open(temp_file_path, 'w')
         item_list_string = json.dumps([{'name': item.name, 'price': item.price, 'unit': item.unit} for item in self.item_list])  # convert to string
         user_list_string = json.dumps([
             {'username': user.username,
@@ -478,7 +490,8 @@ class Manager:
         file.write(item_list_string + '\n')
         file.write(user_list_string + '\n')
         file.close()
-        print('* [Succeed] Save data into <' + Manager.DATA_FILE_PATH + '> successfully.')
+        os.replace(temp_file_path, self.data_file_path)
+        print('* [Succeed] Save data into <' + self.data_file_path + '> successfully.')
 
     def logon(self, username: str, password: str) -> int:
         """